@@ -19,3 +19,4 @@
 from .config import Config
 from .constants import CommandStatus, TelState, FocusState
 from .shm import ShmOffsets, shm_read_double, shm_read_int, shm_read_ushort
+from .shm import shm_snapshot, shm_unpack_double, shm_unpack_int, shm_unpack_ushort
@@ -16,9 +16,17 @@
 
 """Helper function to validate and parse the json config file"""
 
-import json
 from rockit.common import daemons, IP, validation
 
+# Prefer a C-accelerated json parser if one is available
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
 CONFIG_SCHEMA = {
     'type': 'object',
     'additionalProperties': False,
@@ -27,7 +35,7 @@ CONFIG_SCHEMA = {
         'query_delay', 'query_timeout_iterations', 'initialization_timeout', 'slew_timeout',
         'ha_soft_limits', 'dec_soft_limits',
         'homing_timeout', 'limit_timeout', 'ping_timeout',
-        'park_positions'
+        'park_positions', 'telescope'
     ],
     'properties': {
         'daemon': {
@@ -131,44 +139,56 @@ CONFIG_SCHEMA = {
             'type': 'number',
             'min': 0,
         }
-    },
-    'anyOf': [
-        {
-            'properties': {
-                'telescope': {
-                    'enum': ['W1m']
-                }
-            },
-            'required': ['security_system_daemon', 'security_system_key', 'focus_tolerance', 'focus_timeout']
-        },
-        {
-            'properties': {
-                'telescope': {
-                    'enum': ['NGTS']
-                }
-            },
-            'required': []
-        },
-    ]
+    }
 }
 
+# Keys that are only required for specific telescopes.
+# These are added to the required keys for the configured telescope instead of using a
+# jsonschema anyOf, which would otherwise evaluate (and collect errors for) every arm on each load.
+TELESCOPE_REQUIRED_KEYS = {
+    'W1m': ['security_system_daemon', 'security_system_key', 'focus_tolerance', 'focus_timeout'],
+    'NGTS': []
+}
+
+
+def validate_config(config_json):
+    """
+    Tests whether a json object matches CONFIG_SCHEMA and has the keys required for its telescope
+    Any errors are raised as a ConfigSchemaViolationError containing the error messages
+    """
+    schema = CONFIG_SCHEMA
+    telescope = config_json.get('telescope') if isinstance(config_json, dict) else None
+    if isinstance(telescope, str) and TELESCOPE_REQUIRED_KEYS.get(telescope):
+        # Missing telescope-specific keys are then reported together with any other violations
+        schema = dict(CONFIG_SCHEMA, required=CONFIG_SCHEMA['required'] + TELESCOPE_REQUIRED_KEYS[telescope])
+
+    validation.validate_config(config_json, schema, {
+        'daemon_name': validation.daemon_name_validator,
+        'machine_name': validation.machine_name_validator
+    })
+
 
 class Config:
     """Daemon configuration parsed from a json file"""
+    __slots__ = (
+        'daemon', 'log_name', 'control_ips', 'query_delay', 'query_timeout_iterations',
+        'initialization_timeout', 'slew_timeout', 'homing_timeout', 'limit_timeout', 'ping_timeout',
+        'ha_soft_limits', 'dec_soft_limits', 'park_positions', 'is_onemetre',
+        'focus_tolerance', 'focus_timeout', 'security_system_daemon', 'security_system_key'
+    )
+
     def __init__(self, config_filename):
         # Will throw on file not found or invalid json
-        with open(config_filename, 'r') as config_file:
-            config_json = json.load(config_file)
+        # _json may be orjson, ujson, or the stdlib json module
+        with open(config_filename, 'rb') as config_file:
+            config_json = _json.loads(config_file.read())
 
         # Will throw on schema violations
-        validation.validate_config(config_json, CONFIG_SCHEMA, {
-            'daemon_name': validation.daemon_name_validator,
-            'machine_name': validation.machine_name_validator
-        })
+        validate_config(config_json)
 
         self.daemon = getattr(daemons, config_json['daemon'])
         self.log_name = config_json['log_name']
-        self.control_ips = [getattr(IP, machine) for machine in config_json['control_machines']]
+        self.control_ips = frozenset(getattr(IP, machine) for machine in config_json['control_machines'])
         self.query_delay = config_json['query_delay']
         self.query_timeout_iterations = config_json['query_timeout_iterations']
         self.initialization_timeout = config_json['initialization_timeout']
@@ -187,3 +207,8 @@ class Config:
 
             self.security_system_daemon = getattr(daemons, config_json['security_system_daemon'])
             self.security_system_key = config_json['security_system_key']
+        else:
+            self.focus_tolerance = None
+            self.focus_timeout = None
+            self.security_system_daemon = None
+            self.security_system_key = None
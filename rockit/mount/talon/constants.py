@@ -17,6 +17,11 @@
 """Constants and status codes used by talond"""
 
 
+def _index_table(values):
+    """Converts a dictionary keyed by small non-negative integers into a tuple indexed by key"""
+    return tuple(values.get(i) for i in range(max(values) + 1))
+
+
 class CommandStatus:
     """Numeric return codes"""
     # General error codes
@@ -36,7 +41,7 @@ class CommandStatus:
     OutsideHALimits = 20
     OutsideDecLimits = 21
 
-    _messages = {
+    _messages = _index_table({
         # General error codes
         1: 'error: command failed',
         2: 'error: another command is already running',
@@ -51,7 +56,9 @@ class CommandStatus:
 
         20: 'error: requested coordinates outside HA limits',
         21: 'error: requested coordinates outside Dec limits',
+    })
 
+    _tel_messages = {
         # tel specific codes
         -100: 'error: terminated by user',
         -101: 'error: unable to communicate with telescope daemon',
@@ -61,34 +68,22 @@ class CommandStatus:
     @classmethod
     def message(cls, error_code):
         """Returns a human readable string describing an error code"""
-        if error_code in cls._messages:
-            return cls._messages[error_code]
-        return f'error: Unknown error code {error_code}'
-
+        if 0 <= error_code < len(cls._messages):
+            message = cls._messages[error_code]
+        else:
+            message = cls._tel_messages.get(error_code)
 
-class TelState:
-    """Talon TelState enum"""
-    Absent, Stopped, Hunting, Tracking, Slewing, Homing, Limiting = range(7)
+        if message is not None:
+            return message
+        return f'error: Unknown error code {error_code}'
 
-    _labels = {
-        0: 'DISABLED',
-        1: 'STOPPED',
-        2: 'HUNTING',
-        3: 'TRACKING',
-        4: 'SLEWING',
-        5: 'HOMING',
-        6: 'LIMITING',
-    }
 
-    _colors = {
-        0: 'red',
-        1: 'red',
-        2: 'yellow',
-        3: 'green',
-        4: 'yellow',
-        5: 'yellow',
-        6: 'yellow'
-    }
+class StatusEnum:
+    """Shared label lookup for integer status enums"""
+    _labels = ()
+    _formatted = ()
+    _unknown = 'UNKNOWN'
+    _unknown_formatted = '[b]UNKNOWN[/b]'
 
     @classmethod
     def label(cls, status, formatting=False):
@@ -97,39 +92,28 @@ class TelState:
         Set formatting=true to enable terminal formatting characters
         """
         if formatting:
-            if status in cls._labels and status in cls._colors:
-                return f'[b][{cls._colors[status]}]{cls._labels[status]}[/{cls._colors[status]}][/b]'
-            return '[b][red]UNKNOWN[/red][/b]'
+            if 0 <= status < len(cls._formatted):
+                return cls._formatted[status]
+            return cls._unknown_formatted
 
-        if status in cls._labels:
+        if 0 <= status < len(cls._labels):
             return cls._labels[status]
-        return 'UNKNOWN'
+        return cls._unknown
 
 
-class FocusState:
-    """Focus status built from talon motor flags"""
-    Absent, NotHomed, Homing, Limiting, Ready = range(5)
+class TelState(StatusEnum):
+    """Talon TelState enum"""
+    Absent, Stopped, Hunting, Tracking, Slewing, Homing, Limiting = range(7)
 
-    _labels = {
-        0: 'ABSENT',
-        1: 'NOT_HOMED',
-        2: 'HOMING',
-        3: 'LIMITING',
-        4: 'READY',
-    }
+    _labels = ('DISABLED', 'STOPPED', 'HUNTING', 'TRACKING', 'SLEWING', 'HOMING', 'LIMITING')
+    _colors = ('red', 'red', 'yellow', 'green', 'yellow', 'yellow', 'yellow')
+    _formatted = tuple(f'[b][{c}]{l}[/{c}][/b]' for l, c in zip(_labels, _colors))
+    _unknown_formatted = '[b][red]UNKNOWN[/red][/b]'
 
-    @classmethod
-    def label(cls, status, formatting=False):
-        """
-        Returns a human readable string describing a status
-        Set formatting=true to enable terminal formatting characters
-        """
-        if status in cls._labels:
-            label = cls._labels[status]
-        else:
-            label = 'UNKNOWN'
 
-        if formatting:
-            return f'[b]{label}[/b]'
+class FocusState(StatusEnum):
+    """Focus status built from talon motor flags"""
+    Absent, NotHomed, Homing, Limiting, Ready = range(5)
 
-        return label
+    _labels = ('ABSENT', 'NOT_HOMED', 'HOMING', 'LIMITING', 'READY')
+    _formatted = tuple(f'[b]{l}[/b]' for l in _labels)
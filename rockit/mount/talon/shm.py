@@ -67,16 +67,43 @@ class ShmOffsets:
     FocusDF = 704
 
 
+# Precompiled so the format strings are only parsed once.
+# Talon writes the segment in its host's native byte order; '=' keeps that with standard sizes and no alignment.
+_unpack_double = struct.Struct('=d').unpack_from
+_unpack_int = struct.Struct('=i').unpack_from
+_unpack_ushort = struct.Struct('=H').unpack_from
+
+
 def shm_read_double(shm, offset):
     """read a double from a specified offset in a specified shared memory segment"""
-    return struct.unpack_from('d', shm.read(8, offset))[0]
+    return _unpack_double(shm.read(8, offset))[0]
 
 
 def shm_read_int(shm, offset):
     """read an int from a specified offset in a specified shared memory segment"""
-    return struct.unpack_from('i', shm.read(4, offset))[0]
+    return _unpack_int(shm.read(4, offset))[0]
 
 
 def shm_read_ushort(shm, offset):
     """read a ushort from a specified offset in a specified shared memory segment"""
-    return struct.unpack_from('H', shm.read(2, offset))[0]
+    return _unpack_ushort(shm.read(2, offset))[0]
+
+
+def shm_snapshot(shm):
+    """copy the full contents of a specified shared memory segment in a single read"""
+    return shm.read()
+
+
+def shm_unpack_double(data, offset):
+    """unpack a double from a specified offset in a shared memory snapshot"""
+    return _unpack_double(data, offset)[0]
+
+
+def shm_unpack_int(data, offset):
+    """unpack an int from a specified offset in a shared memory snapshot"""
+    return _unpack_int(data, offset)[0]
+
+
+def shm_unpack_ushort(data, offset):
+    """unpack a ushort from a specified offset in a shared memory snapshot"""
+    return _unpack_ushort(data, offset)[0]